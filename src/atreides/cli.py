@@ -21,12 +21,22 @@ def _make_exchange() -> KalshiExchange:
     return KalshiExchange(settings)
 
 
+def _watch_table(title: str) -> Table:
+    table = Table(title=title)
+    table.add_column("Time")
+    table.add_column("Bid", style="green")
+    table.add_column("Ask", style="red")
+    table.add_column("Mid", style="bold")
+    table.add_column("Spread", style="yellow")
+    return table
+
+
 async def _markets_cmd(limit: int = 20, status: str = "open") -> None:
     """List active markets."""
     ex = _make_exchange()
     await ex.connect()
     try:
-        markets = await ex.get_markets(limit=limit, status=status)
+        markets = await ex.get_markets_iter(limit=limit, status=status)
         table = Table(title=f"Kalshi Markets ({status})", expand=True)
         table.add_column("Ticker", style="cyan", no_wrap=True, ratio=1)
         table.add_column("Title", ratio=2)
@@ -35,7 +45,9 @@ async def _markets_cmd(limit: int = 20, status: str = "open") -> None:
         table.add_column("Sprd", justify="right", style="yellow", width=5)
         table.add_column("Vol", justify="right", width=7)
 
+        shown = 0
         for m in markets:
+            shown += 1
             table.add_row(
                 m.ticker,
                 m.title,
@@ -45,7 +57,7 @@ async def _markets_cmd(limit: int = 20, status: str = "open") -> None:
                 f"{m.volume:,}",
             )
         console.print(table)
-        console.print(f"\n[dim]{len(markets)} markets shown[/dim]")
+        console.print(f"\n[dim]{shown} markets shown[/dim]")
     finally:
         await ex.close()
 
@@ -90,35 +102,24 @@ async def _watch_cmd(ticker: str, interval: float = 2.0) -> None:
     try:
         market = await ex.get_market(ticker)
         console.print(f"[bold]Watching: {market.title}[/bold]")
-        console.print(f"[dim]Ctrl+C to stop. Polling every {interval}s[/dim]\n")
-
-        table = Table()
-        table.add_column("Time")
-        table.add_column("Bid", style="green")
-        table.add_column("Ask", style="red")
-        table.add_column("Mid", style="bold")
-        table.add_column("Spread", style="yellow")
-
-        with Live(table, console=console, refresh_per_second=1) as live:
-            while True:
-                book = await ex.get_orderbook(ticker)
+        if settings.kalshi_key_id and settings.kalshi_private_key_path:
+            console.print("[dim]Ctrl+C to stop. Streaming live updates[/dim]\n")
+        else:
+            console.print(f"[dim]Ctrl+C to stop. Polling every {interval}s[/dim]\n")
+
+        title = f"{market.ticker} — Live"
+        with Live(_watch_table(title), console=console, refresh_per_second=1) as live:
+            async for book in ex.stream_orderbook(ticker, poll_interval=interval):
                 now = time.strftime("%H:%M:%S")
 
-                table = Table(title=f"{market.ticker} — Live")
-                table.add_column("Time")
-                table.add_column("Bid", style="green")
-                table.add_column("Ask", style="red")
-                table.add_column("Mid", style="bold")
-                table.add_column("Spread", style="yellow")
-
                 bid = f"${book.best_bid:.2f}" if book.best_bid else "—"
                 ask = f"${book.best_ask:.2f}" if book.best_ask else "—"
                 mid = f"${book.mid:.2f}" if book.mid else "—"
                 spread = f"${book.spread:.2f}" if book.spread else "—"
+                # A fresh one-row table per update; Rich has no public API to clear rows
+                table = _watch_table(title)
                 table.add_row(now, bid, ask, mid, spread)
-
-                live.update(table)
-                await asyncio.sleep(interval)
+                live.update(table)  # picked up by the 1 Hz auto-refresh
     except KeyboardInterrupt:
         console.print("\n[dim]Stopped.[/dim]")
     finally:
@@ -132,10 +133,12 @@ async def _balance_cmd() -> None:
     ex = _make_exchange()
     await ex.connect()
     try:
-        balance = await ex.get_balance()
-        positions = await ex.get_positions()
+        balance, positions = await asyncio.gather(ex.get_balance(), ex.get_positions())
 
-        active = [p for p in positions if p.position_status == PositionStatus.ACTIVE]
+        active = sorted(
+            (p for p in positions if p.position_status == PositionStatus.ACTIVE),
+            key=lambda p: p.market_id,
+        )
         settled = [p for p in positions if p.position_status != PositionStatus.ACTIVE]
 
         # Active positions
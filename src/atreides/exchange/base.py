@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from decimal import Decimal
 from typing import Protocol, runtime_checkable
 
@@ -40,6 +41,10 @@ class Exchange(Protocol):
         """Get current orderbook for a market."""
         ...
 
+    def stream_orderbook(self, market_id: str) -> AsyncIterator[OrderBook]:
+        """Yield the orderbook for a market each time it changes."""
+        ...
+
     async def get_balance(self) -> Decimal:
         """Get account balance in dollars."""
         ...
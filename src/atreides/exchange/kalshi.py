@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
 import json
 import logging
-from collections import defaultdict
+import operator
+import sqlite3
+import ssl
+import time
+from collections import Counter, defaultdict
+from collections.abc import AsyncIterator, Iterable, Iterator
 from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from urllib.parse import urlparse
 
-from kalshi_python import Configuration
+import httpx
+import websockets
+from kalshi_python import Configuration, rest
 from kalshi_python import KalshiClient as KalshiApiClient
 from kalshi_python.api.markets_api import MarketsApi
 from kalshi_python.api.portfolio_api import PortfolioApi
+from kalshi_python.exceptions import ApiException
+from kalshi_python.models.fill import Fill
 
 from atreides.config import Settings
 from atreides.models import (
@@ -28,28 +43,193 @@ log = logging.getLogger(__name__)
 
 # Kalshi prices are in cents (1-99). We convert to dollars (0.01-0.99).
 CENTS = Decimal("100")
+_HUNDREDTH = Decimal("0.01")
+
+# Max concurrent market lookups when pricing positions — keeps us polite to Kalshi.
+MARKET_FETCH_CONCURRENCY = 8
+# Max tickers per batched GET /markets?tickers=... request
+MARKET_BATCH_SIZE = 100
+# WebSocket reconnect backoff after a dropped or server-closed stream (seconds)
+WS_RECONNECT_DELAY = 1.0
+WS_MAX_RECONNECT_DELAY = 30.0
+# HTTP connection pool size — must cover the concurrent fan-out above,
+# otherwise surplus connections are discarded and re-handshaked.
+HTTP_POOL_MAXSIZE = 16
+
+# SDK Market attributes read by _convert_market, fetched in a single C-level call
+_SDK_MARKET_FIELDS = operator.attrgetter(
+    "ticker", "title", "event_ticker", "yes_bid", "yes_ask", "volume", "close_time", "status"
+)
+
+# Fill action -> sign applied to quantity and cost when netting positions
+_ACTION_SIGN = {"buy": 1, "sell": -1}
 
 
+@functools.lru_cache(maxsize=256)
 def _cents_to_dollars(cents: int | float | None) -> Decimal:
+    # Cached: prices are a small set of integers (0-100), hit on every book level.
+    # Aggregate cent totals (balances, costs) divide by CENTS instead so one-off
+    # values don't evict the hot price entries.
     if cents is None:
         return Decimal("0")
-    return Decimal(str(cents)) / CENTS
+    if isinstance(cents, int) or cents.is_integer():
+        return Decimal(int(cents)) * _HUNDREDTH
+    return Decimal(str(cents)) * _HUNDREDTH
+
+
+def _ws_url(api_base: str) -> str:
+    """Derive the WebSocket endpoint from the REST base URL.
+
+    https://demo-api.kalshi.co/trade-api/v2 -> wss://demo-api.kalshi.co/trade-api/ws/v2
+    """
+    parsed = urlparse(api_base)
+    path = parsed.path.replace("/trade-api/", "/trade-api/ws/", 1)
+    return f"wss://{parsed.netloc}{path}"
+
+
+def _orderbook(
+    market_id: str,
+    bids: Iterable[tuple[int, int]],
+    asks: Iterable[tuple[int, int]],
+    depth: int,
+) -> OrderBook:
+    """Build an OrderBook from (price_cents, quantity) levels, best price first.
+
+    Bids sort high to low and asks low to high regardless of the order the
+    API sent them in, so REST snapshots and WebSocket books agree.
+    """
+    return OrderBook.model_construct(
+        market_id=market_id,
+        yes_bids=[BidAsk(_cents_to_dollars(p), q) for p, q in sorted(bids, reverse=True)[:depth]],
+        yes_asks=[BidAsk(_cents_to_dollars(p), q) for p, q in sorted(asks)[:depth]],
+    )
+
+
+class _Http2RestClient:
+    """Stand-in for the SDK's urllib3 REST client, backed by an HTTP/2 httpx.Client.
+
+    Concurrent SDK calls from worker threads are multiplexed over one TLS
+    connection instead of each holding a pooled socket. Only JSON and bodiless
+    requests are sent this way; form/multipart requests go to the SDK's own client.
+
+    Honours the Configuration's verify_ssl, ssl_ca_cert, ca_cert_data,
+    cert_file/key_file and HTTP(S) proxy settings. assert_hostname,
+    tls_server_name, socket_options and retries are not supported, and SOCKS
+    proxies need the SDK client (see KalshiExchange.connect).
+    """
+
+    def __init__(self, fallback: rest.RESTClientObject, config: Configuration) -> None:
+        self._fallback = fallback
+        proxy = None
+        if config.proxy:
+            proxy = httpx.Proxy(config.proxy, headers=config.proxy_headers)
+        self._http = httpx.Client(
+            http2=True,
+            verify=self._ssl_verify(config),
+            proxy=proxy,
+            timeout=None,  # the SDK applies no timeout unless one is passed per request
+            limits=httpx.Limits(
+                max_connections=HTTP_POOL_MAXSIZE, max_keepalive_connections=HTTP_POOL_MAXSIZE
+            ),
+        )
+
+    @staticmethod
+    def _ssl_verify(config: Configuration) -> ssl.SSLContext | bool:
+        """Translate the SDK's urllib3 TLS options into an httpx verify argument."""
+        custom = config.ssl_ca_cert or config.ca_cert_data or config.cert_file
+        if not custom:
+            return bool(config.verify_ssl)
+        ctx = ssl.create_default_context(cafile=config.ssl_ca_cert, cadata=config.ca_cert_data)
+        if not config.verify_ssl:
+            ctx.check_hostname = False
+            ctx.verify_mode = ssl.CERT_NONE
+        if config.cert_file:
+            ctx.load_cert_chain(config.cert_file, config.key_file)
+        return ctx
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict | None = None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> rest.RESTResponse:
+        headers = headers or {}
+        content_type = headers.get("Content-Type")
+        if post_params or (content_type and "json" not in content_type.lower()):
+            return self._fallback.request(
+                method, url, headers, body, post_params, _request_timeout=_request_timeout
+            )
+
+        kwargs = {}
+        if isinstance(_request_timeout, int | float):
+            kwargs["timeout"] = httpx.Timeout(_request_timeout)
+        elif isinstance(_request_timeout, tuple):
+            connect, read = _request_timeout
+            kwargs["timeout"] = httpx.Timeout(None, connect=connect, read=read)
+        has_body = body is not None and method.upper() not in ("GET", "HEAD")
+        try:
+            resp = self._http.request(
+                method,
+                url,
+                headers=headers,
+                content=json.dumps(body) if has_body else None,
+                **kwargs,
+            )
+        except httpx.HTTPError as e:
+            # The SDK's client reports transport failures as ApiException(status=0)
+            raise ApiException(status=0, reason=f"{type(e).__name__}: {e}") from e
+        # RESTResponse only needs the urllib3-style status/reason/data/headers attributes
+        return rest.RESTResponse(
+            SimpleNamespace(
+                status=resp.status_code,
+                reason=resp.reason_phrase,
+                data=resp.content,
+                headers=resp.headers,
+            )
+        )
+
+    def close(self) -> None:
+        self._http.close()
 
 
 class KalshiExchange:
-    """Kalshi prediction market exchange."""
+    """Kalshi prediction market exchange.
+
+    The kalshi_python SDK is synchronous; every SDK call is run via
+    asyncio.to_thread so it doesn't block the event loop and concurrent
+    requests actually overlap.
+    """
 
     name = "kalshi"
 
     def __init__(self, settings: Settings) -> None:
         self._settings = settings
         self._config = Configuration(host=settings.kalshi_api_base)
+        self._config.connection_pool_maxsize = HTTP_POOL_MAXSIZE
         self._client: KalshiApiClient | None = None
+        self._http2: _Http2RestClient | None = None
         self._markets: MarketsApi | None = None
         self._portfolio: PortfolioApi | None = None
+        # ticker -> (fetched_at, market) in fetch order; entries live for
+        # settings.poll_interval seconds and are evicted on the next write
+        self._market_cache: dict[str, tuple[float, Market | None]] = {}
+        self._market_inflight: dict[str, asyncio.Task[Market | None]] = {}
+        # fill_id -> fill, mirrored to disk; loaded lazily on first get_positions
+        self._fill_cache: dict[str, Fill] | None = None
+        self._last_fill_ts: int | None = None
+        # Stable market metadata (title, category, close_time) in data_dir/markets.db
+        self._metadata_db: sqlite3.Connection | None = None
 
     async def connect(self) -> None:
+        if self._client is not None:
+            return  # already connected — keep the existing connection pool
         self._client = KalshiApiClient(self._config)
+        if not rest.is_socks_proxy_url(self._config.proxy):
+            self._http2 = _Http2RestClient(self._client.rest_client, self._config)
+            self._client.rest_client = self._http2
         if self._settings.kalshi_key_id and self._settings.kalshi_private_key_path:
             self._client.set_kalshi_auth(
                 self._settings.kalshi_key_id,
@@ -62,9 +242,17 @@ class KalshiExchange:
         self._portfolio = PortfolioApi(self._client)
 
     async def close(self) -> None:
+        if self._http2 is not None:
+            self._http2.close()
+            self._http2 = None
         self._client = None
         self._markets = None
         self._portfolio = None
+        self._market_cache.clear()
+        self._market_inflight.clear()
+        if self._metadata_db is not None:
+            self._metadata_db.close()
+            self._metadata_db = None
 
     def _require_client(self) -> KalshiApiClient:
         if self._client is None:
@@ -90,13 +278,23 @@ class KalshiExchange:
         cursor: str | None = None,
         status: str = "open",
     ) -> list[Market]:
+        return list(await self.get_markets_iter(limit=limit, cursor=cursor, status=status))
+
+    async def get_markets_iter(
+        self,
+        *,
+        limit: int = 100,
+        cursor: str | None = None,
+        status: str = "open",
+    ) -> Iterator[Market]:
+        """Like get_markets, but converts each market lazily as it's consumed."""
         api = self._require_markets_api()
-        resp = api.get_markets(limit=limit, cursor=cursor, status=status)
-        return [self._convert_market(m) for m in (resp.markets or [])]
+        resp = await asyncio.to_thread(api.get_markets, limit=limit, cursor=cursor, status=status)
+        return self._iter_markets(resp)
 
     async def get_market(self, market_id: str) -> Market:
         api = self._require_markets_api()
-        resp = api.get_market(ticker=market_id)
+        resp = await asyncio.to_thread(api.get_market, ticker=market_id)
         return self._convert_market(resp.market)
 
     async def get_market_safe(self, market_id: str) -> Market | None:
@@ -105,21 +303,63 @@ class KalshiExchange:
         The Kalshi SDK's Market model doesn't include all status values
         (e.g. 'finalized'), causing Pydantic validation errors for some
         markets. This falls back to a raw API call.
+
+        Results are cached for settings.poll_interval seconds, and concurrent
+        callers for the same ticker share a single in-flight request.
         """
+        cached = self._fresh_markets([market_id])
+        if market_id in cached:
+            return cached[market_id]
+
+        task = self._market_inflight.get(market_id)
+        if task is None:
+            task = asyncio.create_task(self._fetch_market_safe(market_id))
+            self._market_inflight[market_id] = task
+            task.add_done_callback(lambda _: self._market_inflight.pop(market_id, None))
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    def _fresh_markets(self, tickers: Iterable[str]) -> dict[str, Market | None]:
+        """Cache entries (including cached misses) younger than settings.poll_interval."""
+        cutoff = time.monotonic() - self._settings.poll_interval
+        return {
+            t: entry[1]
+            for t in tickers
+            if (entry := self._market_cache.get(t)) is not None and entry[0] > cutoff
+        }
+
+    async def _fetch_market_safe(self, market_id: str) -> Market | None:
         try:
-            return await self.get_market(market_id)
+            market = await self.get_market(market_id)
         except Exception:
-            pass
-        # Fallback: raw HTTP request, bypass SDK validation
-        return await self._get_market_raw(market_id)
+            # Fallback: raw HTTP request, bypass SDK validation
+            market = await self._get_market_raw(market_id)
+        self._cache_markets({market_id: market})
+        return market
+
+    def _cache_markets(self, markets: dict[str, Market | None]) -> None:
+        """Store fetched markets (None = miss) and evict entries past poll_interval.
+
+        Writes re-insert their keys, so the cache stays in fetch order and
+        expired entries are always at the front.
+        """
+        now = time.monotonic()
+        cache = self._market_cache
+        for ticker, market in markets.items():
+            cache.pop(ticker, None)
+            cache[ticker] = (now, market)
+        cutoff = now - self._settings.poll_interval
+        stale = list(itertools.takewhile(lambda t: cache[t][0] <= cutoff, cache))
+        for ticker in stale:
+            del cache[ticker]
 
     async def _get_market_raw(self, ticker: str) -> Market | None:
         """Fetch market via raw API call, bypassing SDK model validation."""
         client = self._require_client()
         url = f"{self._settings.kalshi_api_base}/markets/{ticker}"
         try:
-            resp = client.call_api("GET", url)
-            data = json.loads(resp.data)
+            resp = await asyncio.to_thread(client.call_api, "GET", url)
+            data = json.loads(resp.read())  # RESTResponse.data stays None until read()
             m = data.get("market", {})
             return Market(
                 id=m.get("ticker", ""),
@@ -137,104 +377,241 @@ class KalshiExchange:
             log.debug("Raw market fetch failed for %s", ticker)
             return None
 
+    async def _get_markets_safe(self, tickers: list[str]) -> dict[str, Market | None]:
+        """get_market_safe for several tickers, MARKET_FETCH_CONCURRENCY at a time."""
+        sem = asyncio.Semaphore(MARKET_FETCH_CONCURRENCY)
+
+        async def _bounded(ticker: str) -> Market | None:
+            async with sem:
+                return await self.get_market_safe(ticker)
+
+        fetched = await asyncio.gather(*(_bounded(t) for t in tickers))
+        return dict(zip(tickers, fetched, strict=True))
+
+    async def _get_markets_by_ticker(self, tickers: list[str]) -> dict[str, Market | None]:
+        """Fetch many markets at once via the tickers filter on GET /markets.
+
+        A batch the SDK can't parse (see get_market_safe) is skipped rather
+        than raised — one bad market empties its whole batch — so tickers
+        absent from the result are left to the caller, typically for
+        _get_markets_safe.
+        """
+        api = self._require_markets_api()
+
+        async def _batch(chunk: list[str]) -> list:
+            try:
+                resp = await asyncio.to_thread(
+                    api.get_markets, tickers=",".join(chunk), limit=len(chunk)
+                )
+            except Exception:
+                log.debug("Batch market fetch failed for %d tickers", len(chunk))
+                return []
+            return resp.markets or []
+
+        chunks = [
+            tickers[i : i + MARKET_BATCH_SIZE] for i in range(0, len(tickers), MARKET_BATCH_SIZE)
+        ]
+        markets: dict[str, Market | None] = {}
+        for batch in await asyncio.gather(*(_batch(c) for c in chunks)):
+            for m in batch:
+                market = self._convert_market(m)
+                markets[market.ticker] = market
+        self._cache_markets(markets)
+        return markets
+
     async def get_orderbook(self, market_id: str, *, depth: int = 10) -> OrderBook:
         api = self._require_markets_api()
-        resp = api.get_market_orderbook(ticker=market_id, depth=depth)
+        resp = await asyncio.to_thread(api.get_market_orderbook, ticker=market_id, depth=depth)
         ob = resp.orderbook
-        return OrderBook(
-            market_id=market_id,
-            yes_bids=[
-                BidAsk(price=_cents_to_dollars(level.price), quantity=level.count or 0)
-                for level in (ob.var_true or [])
+        return _orderbook(
+            market_id,
+            [
+                (level.price, level.count or 0)
+                for level in ob.var_true or []
                 if level.price is not None
             ],
-            yes_asks=[
-                BidAsk(price=_cents_to_dollars(level.price), quantity=level.count or 0)
-                for level in (ob.var_false or [])
+            [
+                (level.price, level.count or 0)
+                for level in ob.var_false or []
                 if level.price is not None
             ],
+            depth,
         )
 
+    async def stream_orderbook(
+        self,
+        market_id: str,
+        *,
+        depth: int = 10,
+        poll_interval: float | None = None,
+    ) -> AsyncIterator[OrderBook]:
+        """Yield an updated orderbook every time the book changes.
+
+        Subscribes to the WebSocket orderbook_delta channel: a snapshot resets
+        the local book and each delta adjusts a single price level. A sequence
+        gap resubscribes at once (after WS_RECONNECT_DELAY if the previous
+        reconnect was also a gap); a dropped, server-closed or failed
+        connection — including 5xx handshake responses — reconnects with
+        exponential backoff. 4xx handshake responses (e.g. bad credentials)
+        are raised. Kalshi's WebSocket API requires
+        authentication, so without credentials this falls back to polling
+        get_orderbook() every poll_interval seconds (default
+        settings.poll_interval).
+        """
+        client = self._require_client()
+        auth = client.kalshi_auth
+        if auth is None:
+            interval = self._settings.poll_interval if poll_interval is None else poll_interval
+            while True:
+                yield await self.get_orderbook(market_id, depth=depth)
+                await asyncio.sleep(interval)
+
+        url = _ws_url(self._settings.kalshi_api_base)
+        subscribe = {
+            "id": 1,
+            "cmd": "subscribe",
+            "params": {"channels": ["orderbook_delta"], "market_ticker": market_id},
+        }
+        delay = 0.0
+        after_gap = False
+        while True:
+            if delay:
+                await asyncio.sleep(delay)
+            resubscribe = False
+            try:
+                headers = auth.create_auth_headers("GET", urlparse(url).path)
+                async with websockets.connect(url, additional_headers=headers) as ws:
+                    await ws.send(json.dumps(subscribe))
+                    # price (cents) -> quantity, same yes/no -> bids/asks mapping as get_orderbook
+                    bids: dict[int, int] = {}
+                    asks: dict[int, int] = {}
+                    seq: int | None = None
+                    async for raw in ws:
+                        data = json.loads(raw)
+                        kind = data.get("type")
+                        msg = data.get("msg") or {}
+                        if kind == "orderbook_snapshot":
+                            bids = {price: qty for price, qty in msg.get("yes") or []}
+                            asks = {price: qty for price, qty in msg.get("no") or []}
+                        elif kind == "orderbook_delta":
+                            if seq is not None and data.get("seq") != seq + 1:
+                                log.warning(
+                                    "Orderbook sequence gap for %s — resubscribing", market_id
+                                )
+                                resubscribe = True
+                                break
+                            levels = bids if msg.get("side") == "yes" else asks
+                            price = msg["price"]
+                            qty = levels.get(price, 0) + msg["delta"]
+                            if qty > 0:
+                                levels[price] = qty
+                            else:
+                                levels.pop(price, None)
+                        elif kind == "error":
+                            raise RuntimeError(f"Kalshi WebSocket error: {msg}")
+                        else:
+                            continue
+                        seq = data.get("seq")
+                        delay = 0.0  # healthy stream — reset the backoff
+                        yield _orderbook(market_id, bids.items(), asks.items(), depth)
+            except websockets.InvalidStatus as e:
+                if e.response.status_code < 500:
+                    raise  # retrying won't fix a rejected request
+                log.warning("Orderbook stream for %s refused (%s) — reconnecting", market_id, e)
+            except (websockets.WebSocketException, OSError) as e:
+                log.warning("Orderbook stream for %s dropped (%s) — reconnecting", market_id, e)
+            if resubscribe and not after_gap:
+                delay = 0.0  # a single gap only needs a fresh snapshot, not a pause
+            else:
+                # Closed, dropped or refused, or a second gap in a row: back off
+                # exponentially so a failing or out-of-order server isn't hammered.
+                delay = min(max(delay * 2, WS_RECONNECT_DELAY), WS_MAX_RECONNECT_DELAY)
+            after_gap = resubscribe
+
     # ── Portfolio ────────────────────────────────────────────────
 
     async def get_balance(self) -> Decimal:
         api = self._require_portfolio_api()
-        resp = api.get_balance()
-        return _cents_to_dollars(resp.balance)
+        resp = await asyncio.to_thread(api.get_balance)
+        return Decimal(resp.balance or 0) / CENTS
 
     async def get_positions(self) -> list[Position]:
         """Reconstruct positions from fill history and settlements.
 
         The SDK's get_positions() endpoint returns empty for many accounts.
         This rebuilds the portfolio from the ground truth: trade fills
-        minus settlement payouts.
+        minus settlement payouts. Positions are returned in no particular order.
         """
-        api = self._require_portfolio_api()
-
-        # 1. Paginate all fills
-        fills = []
-        cursor = None
-        for _ in range(50):  # safety cap
-            resp = api.get_fills(limit=100, cursor=cursor)
-            batch = resp.fills or []
-            fills.extend(batch)
-            cursor = resp.cursor
-            if not cursor or not batch:
-                break
+        # 1-2. Paginate fills and settlements concurrently — neither depends on the other
+        fills, settlements = await asyncio.gather(
+            self._paginate_fills(), self._paginate_settlements()
+        )
 
-        # 2. Paginate all settlements
-        settled_tickers: dict[str, Decimal] = {}
-        cursor = None
-        for _ in range(50):
-            resp = api.get_settlements(limit=100, cursor=cursor)
-            batch = resp.settlements or []
-            for s in batch:
-                ticker = s.ticker or ""
-                revenue = _cents_to_dollars(s.revenue)
-                settled_tickers[ticker] = settled_tickers.get(ticker, Decimal("0")) + revenue
-            cursor = resp.cursor
-            if not cursor or not batch:
-                break
+        # Sum revenue in integer cents; convert to Decimal once per ticker
+        settled_cents: Counter[str] = Counter()
+        for s in settlements:
+            settled_cents[s.ticker or ""] += int(s.revenue or 0)
+        settled_tickers = {t: Decimal(c) / CENTS for t, c in settled_cents.items()}
 
         # 3. Net fills into positions
-        agg: dict[str, dict] = defaultdict(
-            lambda: {"quantity": 0, "cost": Decimal("0"), "side": "yes"}
-        )
+        # Cost is accumulated in cents: plain ints for whole-cent prices, exact
+        # Decimals for the occasional fractional one (the SDK types price as
+        # int | float). Dollar conversion happens once per ticker below.
+        agg: dict[str, dict] = defaultdict(lambda: {"quantity": 0, "cost_cents": 0, "side": "yes"})
         for f in fills:
-            key = f.ticker
-            if f.action == "buy":
-                agg[key]["quantity"] += f.count
-                agg[key]["cost"] += Decimal(str(f.count)) * _cents_to_dollars(f.price)
-            else:
-                agg[key]["quantity"] -= f.count
-                agg[key]["cost"] -= Decimal(str(f.count)) * _cents_to_dollars(f.price)
-            agg[key]["side"] = f.side
-
-        # 4. Build Position objects, fetch prices for active markets
+            signed_count = _ACTION_SIGN.get(f.action, 0) * f.count
+            price = f.price or 0
+            if isinstance(price, float):
+                price = int(price) if price.is_integer() else Decimal(str(price))
+            bucket = agg[f.ticker]
+            bucket["quantity"] += signed_count
+            bucket["cost_cents"] += signed_count * price
+            bucket["side"] = f.side
+
+        # 4. Partition into settled and active; settled positions need no price,
+        # only a title, which comes from the on-disk metadata cache
+        titles = self._cached_titles([t for t, d in agg.items() if d["quantity"] != 0])
         positions = []
-        for ticker, data in sorted(agg.items()):
+        active_items: list[tuple[str, Side, int, Decimal]] = []
+        for ticker, data in agg.items():
             if data["quantity"] == 0:
                 continue
 
             side = Side.YES if data["side"] == "yes" else Side.NO
+            cost_basis = Decimal(data["cost_cents"]) / CENTS
 
             if ticker in settled_tickers:
                 positions.append(
-                    Position(
+                    Position.model_construct(
                         market_id=ticker,
+                        market_title=titles.get(ticker, ""),
                         side=side,
                         quantity=data["quantity"],
-                        cost_basis=data["cost"],
+                        cost_basis=cost_basis,
                         settlement_revenue=settled_tickers[ticker],
                         position_status=PositionStatus.SETTLED,
                     )
                 )
                 continue
 
-            # Active — fetch current price
-            market = await self.get_market_safe(ticker)
+            active_items.append((ticker, side, data["quantity"], cost_basis))
+
+        # 5. Fetch current prices for all active markets in batched requests;
+        # anything the batch didn't return is retried per ticker, so only the
+        # markets the SDK actually can't parse end up on the raw HTTP fallback
+        # (markets fetched within the last poll_interval are reused from the cache)
+        tickers = [t for t, *_ in active_items]
+        markets = self._fresh_markets(tickers)
+        markets.update(await self._get_markets_by_ticker([t for t in tickers if t not in markets]))
+        missing = [t for t in tickers if t not in markets]
+        if missing:
+            markets.update(await self._get_markets_safe(missing))
+        self._remember_markets(markets.values())
+
+        for ticker, side, quantity, cost_basis in active_items:
+            market = markets[ticker]
             current_price = None
-            title = ""
+            title = titles.get(ticker, "")
             status = PositionStatus.UNKNOWN
             if market is not None:
                 title = market.title
@@ -246,12 +623,12 @@ class KalshiExchange:
                     status = PositionStatus.SETTLED
 
             positions.append(
-                Position(
+                Position.model_construct(
                     market_id=ticker,
                     market_title=title,
                     side=side,
-                    quantity=data["quantity"],
-                    cost_basis=data["cost"],
+                    quantity=quantity,
+                    cost_basis=cost_basis,
                     current_price=current_price,
                     position_status=status,
                 )
@@ -259,6 +636,155 @@ class KalshiExchange:
 
         return positions
 
+    # Metadata cache — best effort. Queries are local and tiny, so they run
+    # inline rather than via to_thread (sqlite connections are thread-bound).
+
+    def _metadata(self) -> sqlite3.Connection:
+        if self._metadata_db is None:
+            path = Path(self._settings.data_dir) / "markets.db"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path)
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS markets("
+                "ticker TEXT PRIMARY KEY, title TEXT, category TEXT, close_time TEXT)"
+            )
+            self._metadata_db = db
+        return self._metadata_db
+
+    def _cached_titles(self, tickers: list[str]) -> dict[str, str]:
+        if not tickers:
+            return {}
+        placeholders = ",".join("?" * len(tickers))
+        try:
+            rows = self._metadata().execute(
+                f"SELECT ticker, title FROM markets WHERE ticker IN ({placeholders})", tickers
+            )
+            return dict(rows.fetchall())
+        except (OSError, sqlite3.Error):
+            log.debug("Market metadata cache unavailable", exc_info=True)
+            return {}
+
+    def _remember_markets(self, markets: Iterable[Market | None]) -> None:
+        rows = [
+            (
+                m.ticker,
+                m.title,
+                m.category or None,
+                m.close_time.isoformat() if m.close_time else None,
+            )
+            for m in markets
+            if m is not None and m.ticker
+        ]
+        if not rows:
+            return
+        try:
+            with self._metadata() as db:
+                # The raw-JSON path has no close_time; keep what an earlier fetch stored
+                db.executemany(
+                    "INSERT INTO markets VALUES (?, ?, ?, ?) ON CONFLICT(ticker) DO UPDATE SET "
+                    "title = excluded.title, "
+                    "category = COALESCE(excluded.category, markets.category), "
+                    "close_time = COALESCE(excluded.close_time, markets.close_time)",
+                    rows,
+                )
+        except (OSError, sqlite3.Error):
+            log.debug("Could not update market metadata cache", exc_info=True)
+
+    async def _paginate_fills(self) -> list[Fill]:
+        """Return the full fill history, fetching only fills newer than the cache.
+
+        Fills are persisted to settings.data_dir/fills.json per account, so
+        repeat runs ask Kalshi only for recent fills and merge them in,
+        de-duplicated by fill_id. The API documents min_ts as "after this
+        timestamp" and cached timestamps are floored to whole seconds, so the
+        query starts one second before the newest cached fill; the overlap is
+        dropped by the fill_id dedupe.
+        """
+        self._require_portfolio_api()
+        if self._fill_cache is None:
+            self._fill_cache, self._last_fill_ts = await asyncio.to_thread(self._load_fill_cache)
+        cache = self._fill_cache
+
+        min_ts = None if self._last_fill_ts is None else self._last_fill_ts - 1
+        new_fills = await self._fetch_fills(min_ts)
+        if any(f.fill_id is None for f in new_fills):
+            # Without ids fills can't be de-duplicated or cached safely; use the
+            # full history for this run and leave the cache untouched
+            log.warning("Kalshi returned fills without fill_id — skipping the fill cache")
+            return new_fills if min_ts is None else await self._fetch_fills(None)
+
+        added = [f for f in new_fills if f.fill_id not in cache]
+        if added:
+            cache.update((f.fill_id, f) for f in added)
+            timestamps = [int(f.created_time.timestamp()) for f in added if f.created_time]
+            if timestamps:
+                self._last_fill_ts = max([*timestamps, self._last_fill_ts or 0])
+            await asyncio.to_thread(self._save_fill_cache)
+        return list(cache.values())
+
+    async def _fetch_fills(self, min_ts: int | None) -> list[Fill]:
+        """Fetch fills after min_ts (all fills if None), following cursors."""
+        api = self._require_portfolio_api()
+        fills: list[Fill] = []
+        cursor = None
+        seen_cursors: set[str] = set()
+        for _ in range(50):  # safety cap
+            resp = await asyncio.to_thread(api.get_fills, limit=100, cursor=cursor, min_ts=min_ts)
+            batch = resp.fills or []
+            fills.extend(batch)
+            cursor = resp.cursor
+            if not cursor or not batch or cursor in seen_cursors:
+                break  # done, or a stale cursor looping back on itself
+            seen_cursors.add(cursor)
+        return fills
+
+    def _fill_cache_path(self) -> Path:
+        return Path(self._settings.data_dir) / "fills.json"
+
+    def _fill_cache_account(self) -> str:
+        return f"{self._settings.kalshi_api_base}|{self._settings.kalshi_key_id}"
+
+    def _load_fill_cache(self) -> tuple[dict[str, Fill], int | None]:
+        """Read cached fills and the newest fill timestamp for this account."""
+        try:
+            data = json.loads(self._fill_cache_path().read_text())
+            fills = [Fill.model_validate(d) for d in data.get("fills", [])]
+        except (OSError, ValueError):
+            log.debug("No usable fill cache at %s", self._fill_cache_path())
+            return {}, None
+        if data.get("account") != self._fill_cache_account():
+            return {}, None  # different account or environment — start fresh
+        return {f.fill_id: f for f in fills}, data.get("last_ts")
+
+    def _save_fill_cache(self) -> None:
+        path = self._fill_cache_path()
+        data = {
+            "account": self._fill_cache_account(),
+            "last_ts": self._last_fill_ts,
+            "fills": [f.model_dump(mode="json") for f in (self._fill_cache or {}).values()],
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data))
+        except OSError:
+            log.warning("Could not write fill cache to %s", path)
+
+    async def _paginate_settlements(self) -> list:
+        """Fetch all settlements, following cursors."""
+        api = self._require_portfolio_api()
+        settlements = []
+        cursor = None
+        seen_cursors: set[str] = set()
+        for _ in range(50):  # safety cap
+            resp = await asyncio.to_thread(api.get_settlements, limit=100, cursor=cursor)
+            batch = resp.settlements or []
+            settlements.extend(batch)
+            cursor = resp.cursor
+            if not cursor or not batch or cursor in seen_cursors:
+                break  # done, or a stale cursor looping back on itself
+            seen_cursors.add(cursor)
+        return settlements
+
     # ── Trading (Phase 3) ────────────────────────────────────────
 
     async def place_order(self, order: OrderRequest) -> OrderResponse:
@@ -269,18 +795,29 @@ class KalshiExchange:
 
     # ── Helpers ──────────────────────────────────────────────────
 
+    @classmethod
+    def _iter_markets(cls, resp) -> Iterator[Market]:
+        for m in resp.markets or []:
+            yield cls._convert_market(m)
+
     @staticmethod
     def _convert_market(m) -> Market:
-        """Convert Kalshi SDK Market to our domain Market."""
-        return Market(
-            id=m.ticker or "",
-            ticker=m.ticker or "",
-            title=m.title or "",
-            category=m.event_ticker or "",
-            yes_bid=_cents_to_dollars(m.yes_bid),
-            yes_ask=_cents_to_dollars(m.yes_ask),
-            volume=m.volume or 0,
-            close_time=m.close_time,
-            status=m.status or "unknown",
+        """Convert Kalshi SDK Market to our domain Market.
+
+        The SDK has already validated m, so skip re-validation.
+        """
+        ticker, title, event_ticker, yes_bid, yes_ask, volume, close_time, status = (
+            _SDK_MARKET_FIELDS(m)
+        )
+        return Market.model_construct(
+            id=ticker or "",
+            ticker=ticker or "",
+            title=title or "",
+            category=event_ticker or "",
+            yes_bid=_cents_to_dollars(yes_bid),
+            yes_ask=_cents_to_dollars(yes_ask),
+            volume=volume or 0,
+            close_time=close_time,
+            status=status or "unknown",
             exchange="kalshi",
         )
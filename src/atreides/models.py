@@ -5,8 +5,9 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from decimal import Decimal
 from enum import StrEnum
+from typing import NamedTuple
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Side(StrEnum):
@@ -36,6 +37,8 @@ class OrderStatus(StrEnum):
 class Market(BaseModel):
     """A binary prediction market."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     id: str
     ticker: str
     title: str
@@ -57,8 +60,11 @@ class Market(BaseModel):
         return self.yes_ask - self.yes_bid
 
 
-class BidAsk(BaseModel):
-    """Single price level in an orderbook."""
+class BidAsk(NamedTuple):
+    """Single price level in an orderbook.
+
+    A plain tuple rather than a model — built per level on every book poll.
+    """
 
     price: Decimal
     quantity: int
@@ -67,6 +73,8 @@ class BidAsk(BaseModel):
 class OrderBook(BaseModel):
     """Orderbook snapshot for a market."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     market_id: str
     yes_bids: list[BidAsk] = Field(default_factory=list)
     yes_asks: list[BidAsk] = Field(default_factory=list)
@@ -127,6 +135,8 @@ class PositionStatus(StrEnum):
 class Position(BaseModel):
     """Current position in a market."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     market_id: str
     market_title: str = ""
     side: Side = Side.YES
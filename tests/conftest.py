@@ -0,0 +1,22 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from atreides.config import Settings
+
+
+@pytest.fixture(scope="session")
+def base_settings() -> Settings:
+    """Trusted test values; tests derive overrides with model_copy().
+
+    model_construct() skips validation and also ignores ATREIDES_* env vars
+    and .env, so a developer's local config can't leak into tests.
+    """
+    return Settings.model_construct(
+        kalshi_api_base="https://demo-api.kalshi.co/trade-api/v2",
+        kalshi_key_id="",
+        kalshi_private_key_path="",
+        max_position_per_market=10,
+        max_total_exposure=50,
+        max_daily_loss=20,
+    )
@@ -1,65 +1,216 @@
 """Tests for Kalshi exchange adapter (unit tests with mocked SDK)."""
 
+import asyncio
+import json
+import ssl
+from datetime import UTC, datetime
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import certifi
+import httpx
 import pytest
+import websockets
+from kalshi_python import Configuration
+from kalshi_python.exceptions import ApiException
+from kalshi_python.models.fill import Fill
+from websockets.datastructures import Headers
+from websockets.http11 import Response
 
 from atreides.config import Settings
-from atreides.exchange.kalshi import KalshiExchange, _cents_to_dollars
+from atreides.exchange import kalshi
+from atreides.exchange.kalshi import KalshiExchange, _cents_to_dollars, _Http2RestClient
+from atreides.models import Market, Position, PositionStatus
 
 
-def _settings() -> Settings:
-    return Settings(
-        kalshi_api_base="https://demo-api.kalshi.co/trade-api/v2",
-        kalshi_key_id="",
-        kalshi_private_key_path="",
+def _fill(ticker: str, action: str, count: int, price: float, ts: int = 1_700_000_000) -> Fill:
+    return Fill(
+        fill_id=f"{ticker}-{action}-{ts}",
+        ticker=ticker,
+        side="yes",
+        action=action,
+        count=count,
+        price=price,
+        created_time=datetime.fromtimestamp(ts, UTC),
     )
 
 
+def _fills_resp(fills: list[Fill]) -> SimpleNamespace:
+    return SimpleNamespace(fills=fills, cursor=None)
+
+
+def _sdk_market(ticker: str = "TICKER-A", **overrides) -> SimpleNamespace:
+    fields = {
+        "ticker": ticker,
+        "title": "Will X happen?",
+        "event_ticker": "EVENT-X",
+        "yes_bid": 40,
+        "yes_ask": 60,
+        "volume": 1000,
+        "close_time": None,
+        "status": "open",
+    }
+    return SimpleNamespace(**(fields | overrides))
+
+
+async def _load_positions(
+    settings: Settings, fills: list[Fill], settlements: list | None = None
+) -> tuple[list[Position], MagicMock]:
+    """Run get_positions on a fresh exchange; also returns the get_fills mock."""
+    ex = KalshiExchange(settings)
+    with patch("atreides.exchange.kalshi.PortfolioApi") as mock_portfolio:
+        mock_portfolio.return_value.configure_mock(
+            **{
+                "get_fills.return_value": _fills_resp(fills),
+                "get_settlements.return_value": SimpleNamespace(
+                    settlements=settlements or [], cursor=None
+                ),
+            }
+        )
+        await ex.connect()
+        positions = await ex.get_positions()
+        await ex.close()
+    return positions, mock_portfolio.return_value.get_fills
+
+
+def _snapshot(seq: int, *, yes: list, no: list) -> dict:
+    msg = {"market_ticker": "TEST", "yes": yes, "no": no}
+    return {"type": "orderbook_snapshot", "sid": 1, "seq": seq, "msg": msg}
+
+
+def _delta(seq: int, price: int, delta: int, side: str) -> dict:
+    msg = {"market_ticker": "TEST", "price": price, "delta": delta, "side": side}
+    return {"type": "orderbook_delta", "sid": 1, "seq": seq, "msg": msg}
+
+
+def _rejected(status: int) -> websockets.InvalidStatus:
+    return websockets.InvalidStatus(Response(status, "", Headers()))
+
+
+class _FakeWebSocket:
+    """Replays messages, then ends cleanly or raises fail."""
+
+    def __init__(self, messages: list[dict], fail: Exception | None = None):
+        self.messages = messages
+        self.fail = fail
+        self.sent = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+    async def __aiter__(self):
+        for m in self.messages:
+            yield json.dumps(m)
+        if self.fail is not None:
+            raise self.fail
+
+
 class TestCentsToDollars:
-    def test_converts_integer(self):
-        assert _cents_to_dollars(50) == Decimal("0.50")
+    @pytest.mark.parametrize(
+        ("cents", "expected"),
+        [
+            (50, Decimal("0.50")),
+            (0, Decimal("0")),
+            (None, Decimal("0")),
+            (33.0, Decimal("0.33")),
+        ],
+        ids=["integer", "zero", "none", "float"],
+    )
+    def test_converts(self, cents, expected):
+        assert _cents_to_dollars(cents) == expected
+
+
+class TestHttp2RestClient:
+    def test_get_returns_sdk_response(self):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, json={"market": {"ticker": "TEST"}})
+
+        fallback = MagicMock()
+        client = _Http2RestClient(fallback, Configuration())
+        client._http = httpx.Client(transport=httpx.MockTransport(handler))
 
-    def test_converts_zero(self):
-        assert _cents_to_dollars(0) == Decimal("0")
+        resp = client.request("GET", "https://example.test/markets/TEST", headers={"X-A": "1"})
 
-    def test_converts_none(self):
-        assert _cents_to_dollars(None) == Decimal("0")
+        assert resp.status == 200
+        assert json.loads(resp.read()) == {"market": {"ticker": "TEST"}}
+        assert resp.getheader("content-type") == "application/json"
+        assert seen[0].headers["X-A"] == "1"
+        assert seen[0].content == b""
+        fallback.request.assert_not_called()
 
-    def test_converts_float(self):
-        assert _cents_to_dollars(33.0) == Decimal("0.33")
+    def test_form_requests_use_sdk_client(self):
+        fallback = MagicMock()
+        client = _Http2RestClient(fallback, Configuration())
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+
+        client.request("POST", "https://example.test/x", headers=headers, post_params=[("a", 1)])
+
+        fallback.request.assert_called_once()
+
+    def test_transport_errors_raise_api_exception(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        client = _Http2RestClient(MagicMock(), Configuration())
+        client._http = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(ApiException) as exc_info:
+            client.request("GET", "https://example.test/markets")
+        assert exc_info.value.status == 0
+        assert "connection refused" in exc_info.value.reason
+
+    def test_ssl_options_follow_sdk_configuration(self):
+        config = Configuration(ssl_ca_cert=certifi.where())
+        config.verify_ssl = False
+
+        ctx = _Http2RestClient._ssl_verify(config)
+
+        assert isinstance(ctx, ssl.SSLContext)
+        assert ctx.verify_mode == ssl.CERT_NONE
+        assert _Http2RestClient._ssl_verify(Configuration()) is True
 
 
 class TestKalshiExchange:
     @pytest.fixture
-    def exchange(self):
-        return KalshiExchange(_settings())
+    def settings(self, base_settings, tmp_path):
+        return base_settings.model_copy(update={"data_dir": str(tmp_path)})
+
+    @pytest.fixture
+    def exchange(self, settings):
+        return KalshiExchange(settings)
+
+    @pytest.fixture
+    def mock_markets_api(self):
+        patcher = patch("atreides.exchange.kalshi.MarketsApi")
+        yield patcher.start()
+        patcher.stop()
+
+    @pytest.fixture
+    async def connected_exchange(self, exchange, mock_markets_api):
+        await exchange.connect()
+        yield exchange
+        await exchange.close()
 
-    @pytest.mark.asyncio
     async def test_raises_before_connect(self, exchange):
         with pytest.raises(RuntimeError, match="Not connected"):
             await exchange.get_markets()
 
-    @pytest.mark.asyncio
-    async def test_get_markets(self, exchange):
-        mock_market = MagicMock()
-        mock_market.ticker = "TICKER-A"
-        mock_market.title = "Will X happen?"
-        mock_market.event_ticker = "EVENT-X"
-        mock_market.yes_bid = 40
-        mock_market.yes_ask = 60
-        mock_market.volume = 1000
-        mock_market.close_time = None
-        mock_market.status = "open"
-
-        mock_resp = MagicMock()
-        mock_resp.markets = [mock_market]
-
-        with patch("atreides.exchange.kalshi.MarketsApi") as mock_api:
-            mock_api.return_value.get_markets.return_value = mock_resp
-            await exchange.connect()
-            markets = await exchange.get_markets()
+    async def test_get_markets(self, connected_exchange, mock_markets_api):
+        mock_market = _sdk_market()
+        mock_resp = SimpleNamespace(markets=[mock_market])
+
+        mock_markets_api.return_value.get_markets.return_value = mock_resp
+        markets = await connected_exchange.get_markets()
 
         assert len(markets) == 1
         m = markets[0]
@@ -68,40 +219,330 @@ class TestKalshiExchange:
         assert m.yes_ask == Decimal("0.60")
         assert m.exchange == "kalshi"
 
-    @pytest.mark.asyncio
-    async def test_get_orderbook(self, exchange):
-        mock_bid = MagicMock()
-        mock_bid.price = 45
-        mock_bid.count = 10
+    async def test_get_orderbook(self, connected_exchange, mock_markets_api):
+        # The API lists levels in ascending price order; the book is best-first
+        bids = [SimpleNamespace(price=40, count=5), SimpleNamespace(price=45, count=10)]
+        asks = [SimpleNamespace(price=55, count=8), SimpleNamespace(price=60, count=2)]
+        mock_ob = SimpleNamespace(var_true=bids, var_false=asks)
+        mock_resp = SimpleNamespace(orderbook=mock_ob)
 
-        mock_ask = MagicMock()
-        mock_ask.price = 55
-        mock_ask.count = 8
+        mock_markets_api.return_value.get_market_orderbook.return_value = mock_resp
+        book = await connected_exchange.get_orderbook("TEST")
 
-        mock_ob = MagicMock()
-        mock_ob.var_true = [mock_bid]
-        mock_ob.var_false = [mock_ask]
+        assert book.best_bid == Decimal("0.45")
+        assert book.best_ask == Decimal("0.55")
+        assert book.yes_bids[0].quantity == 10
+
+    async def test_stream_orderbook_applies_deltas(self, exchange):
+        ws = _FakeWebSocket(
+            [
+                {"type": "subscribed", "id": 1, "msg": {"channel": "orderbook_delta", "sid": 1}},
+                _snapshot(1, yes=[[40, 5], [45, 10]], no=[[55, 8]]),
+                _delta(2, price=45, delta=-10, side="yes"),
+                _delta(3, price=52, delta=3, side="no"),
+            ]
+        )
+        with (
+            patch("atreides.exchange.kalshi.KalshiApiClient"),
+            patch("atreides.exchange.kalshi.websockets.connect", return_value=ws) as connect,
+        ):
+            await exchange.connect()
+            stream = exchange.stream_orderbook("TEST")
+            books = [await anext(stream) for _ in range(3)]
+            await stream.aclose()
 
-        mock_resp = MagicMock()
-        mock_resp.orderbook = mock_ob
+        assert connect.call_args.args[0] == "wss://demo-api.kalshi.co/trade-api/ws/v2"
+        assert ws.sent[0]["params"] == {"channels": ["orderbook_delta"], "market_ticker": "TEST"}
 
-        with patch("atreides.exchange.kalshi.MarketsApi") as mock_api:
-            mock_api.return_value.get_market_orderbook.return_value = mock_resp
+        snapshot, after_cancel, after_add = books
+        assert snapshot.best_bid == Decimal("0.45")
+        assert snapshot.best_ask == Decimal("0.55")
+        assert after_cancel.best_bid == Decimal("0.40")
+        assert len(after_cancel.yes_bids) == 1
+        assert after_add.best_ask == Decimal("0.52")
+        assert after_add.yes_asks[1].quantity == 8
+
+    async def test_stream_orderbook_resubscribes_on_sequence_gap(self, exchange):
+        stale = _FakeWebSocket([_snapshot(1, yes=[[40, 5]], no=[[60, 5]]), _delta(3, 41, 1, "yes")])
+        fresh = _FakeWebSocket([_snapshot(1, yes=[[42, 7]], no=[[58, 7]])])
+        with (
+            patch("atreides.exchange.kalshi.KalshiApiClient"),
+            patch(
+                "atreides.exchange.kalshi.websockets.connect", side_effect=[stale, fresh]
+            ) as connect,
+        ):
             await exchange.connect()
-            book = await exchange.get_orderbook("TEST")
+            stream = exchange.stream_orderbook("TEST")
+            books = [await anext(stream) for _ in range(2)]
+            await stream.aclose()
 
-        assert book.best_bid == Decimal("0.45")
-        assert book.best_ask == Decimal("0.55")
-        assert book.yes_bids[0].quantity == 10
+        assert connect.call_count == 2
+        assert fresh.sent[0]["cmd"] == "subscribe"
+        assert [b.best_bid for b in books] == [Decimal("0.40"), Decimal("0.42")]
+
+    async def test_stream_orderbook_reconnects_after_dropped_connection(self, exchange):
+        dropped = _FakeWebSocket(
+            [_snapshot(1, yes=[[40, 5]], no=[[60, 5]])],
+            fail=websockets.ConnectionClosedError(None, None),
+        )
+        fresh = _FakeWebSocket([_snapshot(1, yes=[[42, 7]], no=[[58, 7]])])
+        with (
+            patch("atreides.exchange.kalshi.KalshiApiClient"),
+            patch("atreides.exchange.kalshi.WS_RECONNECT_DELAY", 0),
+            patch(
+                "atreides.exchange.kalshi.websockets.connect", side_effect=[dropped, fresh]
+            ) as connect,
+        ):
+            await exchange.connect()
+            stream = exchange.stream_orderbook("TEST")
+            books = [await anext(stream) for _ in range(2)]
+            await stream.aclose()
+
+        assert connect.call_count == 2
+        assert books[1].best_bid == Decimal("0.42")
+
+    async def test_stream_orderbook_retries_server_errors_on_handshake(self, exchange):
+        fresh = _FakeWebSocket([_snapshot(1, yes=[[42, 7]], no=[[58, 7]])])
+        with (
+            patch("atreides.exchange.kalshi.KalshiApiClient"),
+            patch("atreides.exchange.kalshi.WS_RECONNECT_DELAY", 0),
+            patch(
+                "atreides.exchange.kalshi.websockets.connect",
+                side_effect=[_rejected(503), fresh],
+            ) as connect,
+        ):
+            await exchange.connect()
+            stream = exchange.stream_orderbook("TEST")
+            book = await anext(stream)
+            await stream.aclose()
+
+        assert connect.call_count == 2
+        assert book.best_bid == Decimal("0.42")
+
+    async def test_stream_orderbook_raises_client_errors_on_handshake(self, exchange):
+        with (
+            patch("atreides.exchange.kalshi.KalshiApiClient"),
+            patch("atreides.exchange.kalshi.websockets.connect", side_effect=_rejected(401)),
+        ):
+            await exchange.connect()
+            with pytest.raises(websockets.InvalidStatus):
+                await anext(exchange.stream_orderbook("TEST"))
+
+    async def test_stream_orderbook_backs_off_after_repeated_gaps(self, exchange):
+        def gapped():
+            return _FakeWebSocket(
+                [_snapshot(1, yes=[[40, 5]], no=[[60, 5]]), _delta(3, 41, 1, "yes")]
+            )
 
-    @pytest.mark.asyncio
-    async def test_place_order_not_implemented(self, exchange):
-        with patch("atreides.exchange.kalshi.MarketsApi"):
+        fresh = _FakeWebSocket([_snapshot(1, yes=[[42, 7]], no=[[58, 7]])])
+        with (
+            patch("atreides.exchange.kalshi.KalshiApiClient"),
+            patch("atreides.exchange.kalshi.asyncio.sleep", new_callable=AsyncMock) as sleep,
+            patch(
+                "atreides.exchange.kalshi.websockets.connect",
+                side_effect=[gapped(), gapped(), fresh],
+            ),
+        ):
             await exchange.connect()
+            stream = exchange.stream_orderbook("TEST")
+            books = [await anext(stream) for _ in range(3)]
+            await stream.aclose()
+
+        # The first gap resubscribes at once; the second in a row waits
+        sleep.assert_awaited_once_with(kalshi.WS_RECONNECT_DELAY)
+        assert books[-1].best_bid == Decimal("0.42")
+
+    async def test_stream_orderbook_polls_without_credentials(
+        self, connected_exchange, mock_markets_api
+    ):
+        level = SimpleNamespace(price=45, count=10)
+        mock_ob = SimpleNamespace(var_true=[level], var_false=[])
+        mock_markets_api.return_value.get_market_orderbook.return_value = SimpleNamespace(
+            orderbook=mock_ob
+        )
+
+        with patch("atreides.exchange.kalshi.websockets.connect") as connect:
+            stream = connected_exchange.stream_orderbook("TEST", poll_interval=0)
+            books = [await anext(stream) for _ in range(2)]
+            await stream.aclose()
+
+        connect.assert_not_called()
+        assert mock_markets_api.return_value.get_market_orderbook.call_count == 2
+        assert all(b.best_bid == Decimal("0.45") for b in books)
+
+    async def test_get_market_safe_caches_and_dedupes(self, connected_exchange, mock_markets_api):
+        mock_market = _sdk_market()
+        mock_resp = SimpleNamespace(market=mock_market)
+
+        mock_markets_api.return_value.get_market.return_value = mock_resp
+        first, second = await asyncio.gather(
+            connected_exchange.get_market_safe("TICKER-A"),
+            connected_exchange.get_market_safe("TICKER-A"),
+        )
+        third = await connected_exchange.get_market_safe("TICKER-A")
+
+        assert first is second is third
+        assert first.ticker == "TICKER-A"
+        assert mock_markets_api.return_value.get_market.call_count == 1
+
+    def test_market_cache_evicts_expired_entries(self, exchange):
+        with patch.object(kalshi.time, "monotonic", return_value=1000.0):
+            exchange._cache_markets({"OLD": None, "KEPT": None})
+        with patch.object(kalshi.time, "monotonic", return_value=1004.0):
+            exchange._cache_markets({"KEPT": None})
+        with patch.object(kalshi.time, "monotonic", return_value=1006.0):
+            exchange._cache_markets({"NEW": None})
+
+        # KEPT was refreshed at 1004, so it is still within the 5s poll interval
+        assert list(exchange._market_cache) == ["KEPT", "NEW"]
+
+    async def test_get_positions(self, exchange):
+        def _market(ticker, status):
+            return {
+                "ticker": ticker,
+                "title": f"Title {ticker}",
+                "yes_bid": 40,
+                "yes_ask": 60,
+                "status": status,
+            }
+
+        # ACTIVE-B has a status the SDK's Market model rejects, which fails the
+        # whole batch response; ACTIVE-A must still be priced
+        markets = {
+            "ACTIVE-A": _market("ACTIVE-A", "active"),
+            "ACTIVE-B": _market("ACTIVE-B", "finalized"),
+        }
+        fills = [
+            _fill("ACTIVE-A", "buy", 10, 30),
+            _fill("ACTIVE-B", "buy", 4, 50),
+            _fill("SETTLED", "buy", 5, 20),
+            _fill("FLAT", "buy", 3, 50),
+            _fill("FLAT", "sell", 3, 60),
+        ]
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path.removeprefix("/trade-api/v2")
+            seen.append((path, request.url.params.get("tickers")))
+            if path == "/portfolio/fills":
+                return httpx.Response(
+                    200, json={"fills": [f.model_dump(mode="json") for f in fills]}
+                )
+            if path == "/portfolio/settlements":
+                return httpx.Response(
+                    200, json={"settlements": [{"ticker": "SETTLED", "revenue": 500}]}
+                )
+            if path == "/markets":
+                tickers = request.url.params["tickers"].split(",")
+                return httpx.Response(200, json={"markets": [markets[t] for t in tickers]})
+            return httpx.Response(200, json={"market": markets[path.removeprefix("/markets/")]})
+
+        # Real SDK and RESTResponse objects; only the network is faked
+        await exchange.connect()
+        exchange._http2._http = httpx.Client(transport=httpx.MockTransport(handler))
+        positions = {p.market_id: p for p in await exchange.get_positions()}
+        # A refresh within poll_interval prices every market from the cache
+        await exchange.get_positions()
+        await exchange.close()
+
+        assert set(positions) == {"ACTIVE-A", "ACTIVE-B", "SETTLED"}
+        assert seen.count(("/markets", "ACTIVE-A,ACTIVE-B")) == 1
+        # Per-ticker retry, then the raw fallback for the unparseable market only
+        assert seen.count(("/markets/ACTIVE-A", None)) == 1
+        assert seen.count(("/markets/ACTIVE-B", None)) == 2
+
+        a = positions["ACTIVE-A"]
+        assert a.position_status == PositionStatus.ACTIVE
+        assert a.market_title == "Title ACTIVE-A"
+        assert a.cost_basis == Decimal("3.00")
+        assert a.current_price == Decimal("0.50")
+
+        b = positions["ACTIVE-B"]
+        assert b.position_status == PositionStatus.SETTLED
+        assert b.market_title == "Title ACTIVE-B"
+        assert b.current_price is None
+
+        s = positions["SETTLED"]
+        assert s.position_status == PositionStatus.SETTLED
+        assert s.cost_basis == Decimal("1.00")
+        assert s.settlement_revenue == Decimal("5.00")
+
+    async def test_get_positions_fetches_only_new_fills(self, settings, mock_markets_api):
+        first = _fill("TICKER", "buy", 10, 30, ts=1_700_000_000)
+        positions, get_fills = await _load_positions(settings, [first])
+        assert get_fills.call_args.kwargs["min_ts"] is None
+        assert positions[0].quantity == 10
+
+        # Second run: cached fill is loaded from disk. The query starts a second
+        # early, so a new fill from the same second is still returned; the API
+        # re-sends the cached one too, and only the new one is added.
+        second = _fill("TICKER", "sell", 4, 50, ts=1_700_000_000)
+        positions, get_fills = await _load_positions(settings, [first, second])
+        assert get_fills.call_args.kwargs["min_ts"] == 1_699_999_999
+        assert positions[0].quantity == 6
+        assert positions[0].cost_basis == Decimal("1.00")
+
+    async def test_get_positions_keeps_fractional_fill_prices(self, settings):
+        fills = [_fill("TICKER", "buy", 3, 33.5), _fill("TICKER", "buy", 1, 40.0, ts=1_700_000_001)]
+        settlements = [SimpleNamespace(ticker="TICKER", revenue=400)]
+        (position,), _ = await _load_positions(settings, fills, settlements)
+
+        assert position.cost_basis == Decimal("1.405")  # 3 * 33.5c + 40c
+
+    async def test_get_positions_keeps_fills_without_ids(self, settings, tmp_path):
+        fills = [
+            _fill("TICKER", "buy", 3, 40).model_copy(update={"fill_id": None}),
+            _fill("TICKER", "buy", 2, 40).model_copy(update={"fill_id": None}),
+        ]
+        settlements = [SimpleNamespace(ticker="TICKER", revenue=0)]
+        (position,), _ = await _load_positions(settings, fills, settlements)
+
+        assert position.quantity == 5
+        assert not (tmp_path / "fills.json").exists()
+
+    async def test_settled_position_title_from_metadata_cache(self, settings, mock_markets_api):
+        market = _sdk_market("TICKER")
+        mock_markets_api.return_value.get_markets.return_value = SimpleNamespace(markets=[market])
+        fills = [_fill("TICKER", "buy", 10, 40)]
+        settlement = SimpleNamespace(ticker="TICKER", revenue=1000)
+
+        # First run: market is active and fetched, which records its title
+        (active,), _ = await _load_positions(settings, fills)
+        assert active.position_status == PositionStatus.ACTIVE
+
+        # Later the market settles; no market fetch happens but the title is known
+        (settled,), _ = await _load_positions(settings, fills, [settlement])
+        assert settled.position_status == PositionStatus.SETTLED
+        assert settled.market_title == "Will X happen?"
+
+    async def test_remember_markets_keeps_stored_close_time(self, exchange):
+        close = datetime(2026, 1, 1, tzinfo=UTC)
+        exchange._remember_markets(
+            [Market(id="T", ticker="T", title="Old", category="EVT", close_time=close)]
+        )
+        # The raw-JSON path has no close_time and may lack an event ticker
+        exchange._remember_markets([Market(id="T", ticker="T", title="New")])
+
+        row = exchange._metadata().execute("SELECT * FROM markets").fetchone()
+        await exchange.close()
+        assert row == ("T", "New", "EVT", close.isoformat())
+
+    async def test_paginate_stops_on_repeated_cursor(self, exchange):
+        looping = SimpleNamespace(settlements=[SimpleNamespace()], cursor="STALE")
+
+        with patch("atreides.exchange.kalshi.PortfolioApi") as mock_portfolio:
+            mock_portfolio.return_value.get_settlements.return_value = looping
+            await exchange.connect()
+            settlements = await exchange._paginate_settlements()
+
+        assert mock_portfolio.return_value.get_settlements.call_count == 2
+        assert len(settlements) == 2
+
+    async def test_place_order_not_implemented(self, connected_exchange):
         with pytest.raises(NotImplementedError):
             from atreides.models import OrderRequest, OrderSide, Side
 
-            await exchange.place_order(
+            await connected_exchange.place_order(
                 OrderRequest(
                     market_id="X",
                     side=Side.YES,
@@ -2,33 +2,48 @@
 
 from decimal import Decimal
 
+import pytest
+
 from atreides.models import BidAsk, Market, OrderBook, Position
 
+# Parsed once at import rather than per test
+_D0 = Decimal("0")
+_D040 = Decimal("0.40")
+_D050 = Decimal("0.50")
+_D060 = Decimal("0.60")
+_D300 = Decimal("3.00")
+_D500 = Decimal("5.00")
+_D1000 = Decimal("10.00")
+
+
+@pytest.fixture(scope="module")
+def market() -> Market:
+    # Market is frozen, so one instance can be shared across tests
+    return Market(
+        id="TEST",
+        ticker="TEST",
+        title="Test",
+        yes_bid=_D040,
+        yes_ask=_D060,
+    )
+
 
 class TestMarket:
-    def test_mid_price(self):
-        m = Market(
-            id="TEST",
-            ticker="TEST",
-            title="Test",
-            yes_bid=Decimal("0.40"),
-            yes_ask=Decimal("0.60"),
-        )
-        assert m.mid == Decimal("0.50")
-
-    def test_spread(self):
-        m = Market(
-            id="TEST",
-            ticker="TEST",
-            title="Test",
-            yes_bid=Decimal("0.40"),
-            yes_ask=Decimal("0.60"),
-        )
-        assert m.spread == Decimal("0.20")
+    def test_mid_price(self, market):
+        assert market.mid == _D050
+
+    def test_spread(self, market):
+        assert market.spread == Decimal("0.20")
+
+    def test_derived_values_follow_model_copy(self, market):
+        assert market.mid == _D050
+        m = market.model_copy(update={"yes_bid": Decimal("0.20")})
+        assert m.mid == Decimal("0.40")
+        assert m.spread == Decimal("0.40")
 
     def test_defaults(self):
         m = Market(id="X", ticker="X", title="X")
-        assert m.yes_bid == Decimal("0")
+        assert m.yes_bid == _D0
         assert m.yes_ask == Decimal("1")
         assert m.volume == 0
 
@@ -39,13 +54,13 @@ class TestOrderBook:
             market_id="TEST",
             yes_bids=[
                 BidAsk(price=Decimal("0.45"), quantity=10),
-                BidAsk(price=Decimal("0.40"), quantity=5),
+                BidAsk(price=_D040, quantity=5),
             ],
             yes_asks=[BidAsk(price=Decimal("0.55"), quantity=8)],
         )
         assert book.best_bid == Decimal("0.45")
         assert book.best_ask == Decimal("0.55")
-        assert book.mid == Decimal("0.50")
+        assert book.mid == _D050
         assert book.spread == Decimal("0.10")
 
     def test_empty_book(self):
@@ -61,30 +76,30 @@ class TestPosition:
         p = Position(
             market_id="TEST",
             quantity=10,
-            cost_basis=Decimal("3.00"),
-            current_price=Decimal("0.50"),
+            cost_basis=_D300,
+            current_price=_D050,
         )
-        assert p.market_value == Decimal("5.00")
+        assert p.market_value == _D500
 
     def test_market_value_settled(self):
         p = Position(
             market_id="TEST",
             quantity=10,
-            cost_basis=Decimal("3.00"),
-            settlement_revenue=Decimal("10.00"),
+            cost_basis=_D300,
+            settlement_revenue=_D1000,
         )
-        assert p.market_value == Decimal("10.00")
+        assert p.market_value == _D1000
 
     def test_pnl(self):
         p = Position(
             market_id="TEST",
             quantity=10,
-            cost_basis=Decimal("3.00"),
-            current_price=Decimal("0.50"),
+            cost_basis=_D300,
+            current_price=_D050,
         )
         assert p.pnl == Decimal("2.00")
 
     def test_pnl_no_price(self):
-        p = Position(market_id="TEST", cost_basis=Decimal("5.00"))
-        assert p.market_value == Decimal("0")
+        p = Position(market_id="TEST", cost_basis=_D500)
+        assert p.market_value == _D0
         assert p.pnl == Decimal("-5.00")
@@ -2,89 +2,94 @@
 
 from decimal import Decimal
 
-from atreides.config import Settings
+import pytest
+
 from atreides.models import OrderRequest, OrderSide, Position, PositionStatus, Side
 from atreides.risk import RiskManager
 
+_D050 = Decimal("0.50")
+_D060 = Decimal("0.60")
+_D300 = Decimal("3.00")
+_D800 = Decimal("8.00")
+
+
+_ORDER_TEMPLATE = OrderRequest(
+    market_id="TEST",
+    side=Side.YES,
+    order_side=OrderSide.BUY,
+    price=_D050,
+    quantity=5,
+)
+
+
+def _order(market_id: str = "TEST", price: Decimal = _D050, quantity: int = 5) -> OrderRequest:
+    return _ORDER_TEMPLATE.model_copy(
+        update={"market_id": market_id, "price": price, "quantity": quantity}
+    )
+
 
-def _settings(**overrides) -> Settings:
-    defaults = {
-        "kalshi_api_base": "https://demo-api.kalshi.co/trade-api/v2",
-        "max_position_per_market": 10,
-        "max_total_exposure": 50,
-        "max_daily_loss": 20,
-    }
-    defaults.update(overrides)
-    return Settings(**defaults)
-
-
-def _order(market_id: str = "TEST", price: str = "0.50", quantity: int = 5) -> OrderRequest:
-    return OrderRequest(
-        market_id=market_id,
-        side=Side.YES,
-        order_side=OrderSide.BUY,
-        price=Decimal(price),
-        quantity=quantity,
+@pytest.fixture(scope="module")
+def existing_position() -> Position:
+    # Position is frozen; check_order only reads it, so tests can share one
+    return Position(
+        market_id="EXISTING",
+        quantity=10,
+        cost_basis=_D800,
+        current_price=Decimal("0.80"),
+        position_status=PositionStatus.ACTIVE,
     )
 
 
 class TestRiskManager:
-    def test_allows_small_order(self):
-        rm = RiskManager(_settings())
-        reason = rm.check_order(_order(price="0.50", quantity=5), [])
+    def test_allows_small_order(self, base_settings):
+        rm = RiskManager(base_settings)
+        reason = rm.check_order(_order(price=_D050, quantity=5), [])
         assert reason is None  # $2.50 cost < $10 limit
 
-    def test_rejects_oversized_order(self):
-        rm = RiskManager(_settings(max_position_per_market=5))
-        reason = rm.check_order(_order(price="0.50", quantity=20), [])
+    def test_rejects_oversized_order(self, base_settings):
+        rm = RiskManager(base_settings.model_copy(update={"max_position_per_market": 5}))
+        reason = rm.check_order(_order(price=_D050, quantity=20), [])
         assert reason is not None
         assert "per-market limit" in reason
 
-    def test_kill_switch_on_daily_loss(self):
-        rm = RiskManager(_settings(max_daily_loss=10))
+    def test_checks_current_order_price(self, base_settings):
+        rm = RiskManager(base_settings.model_copy(update={"max_position_per_market": 5}))
+        order = _order(price=_D050, quantity=8)
+        assert rm.check_order(order, []) is None  # $4.00
+        order.price = Decimal("0.90")
+        assert rm.check_order(order, []) is not None  # $7.20
+
+    def test_kill_switch_on_daily_loss(self, base_settings):
+        rm = RiskManager(base_settings.model_copy(update={"max_daily_loss": 10}))
         rm.record_pnl(Decimal("-11"))
         assert rm.is_killed
         reason = rm.check_order(_order(), [])
         assert reason is not None
         assert "Kill switch" in reason
 
-    def test_reset_daily_clears_kill_switch(self):
-        rm = RiskManager(_settings(max_daily_loss=10))
+    def test_reset_daily_clears_kill_switch(self, base_settings):
+        rm = RiskManager(base_settings.model_copy(update={"max_daily_loss": 10}))
         rm.record_pnl(Decimal("-15"))
         assert rm.is_killed
         rm.reset_daily()
         assert not rm.is_killed
 
-    def test_rejects_when_exposure_plus_order_exceeds_limit(self):
+    def test_rejects_when_exposure_plus_order_exceeds_limit(self, base_settings, existing_position):
         # AC: given positions=$8 and limit=$10, a $3 order is rejected
-        position = Position(
-            market_id="EXISTING",
-            quantity=10,
-            cost_basis=Decimal("8.00"),
-            current_price=Decimal("0.80"),
-            position_status=PositionStatus.ACTIVE,
-        )
-        rm = RiskManager(_settings(max_total_exposure=10))
+        rm = RiskManager(base_settings.model_copy(update={"max_total_exposure": 10}))
         # cost = 0.50 * 6 = $3.00; total = $8.00 + $3.00 = $11.00 > $10.00
-        reason = rm.check_order(_order(price="0.50", quantity=6), [position])
+        reason = rm.check_order(_order(price=_D050, quantity=6), [existing_position])
         assert reason is not None
         assert "exposure" in reason
 
-    def test_allows_when_exposure_plus_order_within_limit(self):
+    def test_allows_when_exposure_plus_order_within_limit(self, base_settings, existing_position):
         # AC: given positions=$8 and limit=$10, a $1 order is allowed
-        position = Position(
-            market_id="EXISTING",
-            quantity=10,
-            cost_basis=Decimal("8.00"),
-            current_price=Decimal("0.80"),
-            position_status=PositionStatus.ACTIVE,
-        )
-        rm = RiskManager(_settings(max_total_exposure=10))
+        rm = RiskManager(base_settings.model_copy(update={"max_total_exposure": 10}))
         # cost = 0.50 * 2 = $1.00; total = $8.00 + $1.00 = $9.00 <= $10.00
-        reason = rm.check_order(_order(price="0.50", quantity=2), [position])
+        reason = rm.check_order(_order(price=_D050, quantity=2), [existing_position])
         assert reason is None
 
-    def test_settled_positions_excluded_from_exposure(self):
+    def test_settled_positions_excluded_from_exposure(self, base_settings):
         # AC: settled positions don't count toward total exposure
         settled = Position(
             market_id="SETTLED",
@@ -96,17 +101,17 @@ class TestRiskManager:
         active = Position(
             market_id="ACTIVE",
             quantity=5,
-            cost_basis=Decimal("3.00"),
-            current_price=Decimal("0.60"),
+            cost_basis=_D300,
+            current_price=_D060,
             position_status=PositionStatus.ACTIVE,
         )
-        rm = RiskManager(_settings(max_total_exposure=10))
+        rm = RiskManager(base_settings.model_copy(update={"max_total_exposure": 10}))
         # active market_value = 0.60 * 5 = $3.00; settled is excluded
         # order cost = 0.50 * 6 = $3.00; total = $3.00 + $3.00 = $6.00 <= $10.00
-        reason = rm.check_order(_order(price="0.50", quantity=6), [settled, active])
+        reason = rm.check_order(_order(price=_D050, quantity=6), [settled, active])
         assert reason is None
 
-    def test_unknown_positions_excluded_from_exposure(self):
+    def test_unknown_positions_excluded_from_exposure(self, base_settings):
         # UNKNOWN positions are excluded — their status hasn't been confirmed so
         # including them with market_value=0 would silently bypass the cap
         unknown = Position(
@@ -116,8 +121,8 @@ class TestRiskManager:
             # no current_price — market_value would be $0 if included
             position_status=PositionStatus.UNKNOWN,
         )
-        rm = RiskManager(_settings(max_total_exposure=5))
+        rm = RiskManager(base_settings.model_copy(update={"max_total_exposure": 5}))
         # If unknown were included at market_value=$0, a $4 order would pass.
         # It should still pass — but only because the position is excluded, not zeroed.
-        reason = rm.check_order(_order(price="0.50", quantity=8), [unknown])  # cost=$4
+        reason = rm.check_order(_order(price=_D050, quantity=8), [unknown])  # cost=$4
         assert reason is None